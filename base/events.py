@@ -1,5 +1,15 @@
+import sys
+import threading
+import weakref
+
 from collections import namedtuple
 
+# interned keys used in event.data, so membership tests and lookups
+# against them reduce to pointer compares
+SELF = sys.intern("self")
+SOURCE = sys.intern("source")
+TARGET = sys.intern("target")
+
 
 class EventException(Exception):
     """
@@ -20,7 +30,19 @@ class EventFactory():
 
     @staticmethod
     def create(etype, **data):
-        etype = etype.upper()
+        # intern the normalized type so later dict lookups on it are
+        # pointer compares
+        etype = sys.intern(etype.upper())
+        return Event(etype, data)
+
+    @staticmethod
+    def create_fast(etype, data):
+        """
+        Build an Event from an already-normalized (interned, uppercased)
+        type and a pre-built data dict, skipping the per-call upper()
+        and kwargs packing in `create`. For hot paths emitting a fixed
+        set of event types.
+        """
         return Event(etype, data)
 
 class EventListener():
@@ -32,29 +54,35 @@ class EventListener():
 
     def __init__(self, owner=None):
         self.owner = owner
-        self.publishers = set()
+        # weak refs, so a dead publisher drops out on its own instead
+        # of being retained until this listener is destroyed
+        self.publishers = weakref.WeakSet()
         self.listeners = dict()
         super(EventListener, self).__init__()
 
     def on_notify(self, event):
-        query = event.type.upper()
+        # event.type is already normalized by EventFactory.create, so
+        # no per-dispatch upper() is needed here
 
         # inject self into the event data if not
         # present
-        if "self" not in event.data.keys():
-            event.data["self"] = self.owner
+        if SELF not in event.data:
+            event.data[SELF] = self.owner
 
-        # now send event to listeners
-        if query in self.listeners:
-            self.listeners[query](event.data)
+        # now send event to listeners; a single .get hashes the key
+        # once for the (dominant) hit case
+        handler = self.listeners.get(event.type)
+        if handler is not None:
+            handler(event.data)
 
     def on_destroy(self):
-        for p in self.publishers:
-            p.remove_event_listener(self)
+        for p in list(self.publishers):
+            p.remove_subscriber(self)
 
-        self.publishers = []
+        self.publishers = weakref.WeakSet()
 
     def add_event_listener(self, etype, func):
+        etype = sys.intern(etype)
         if etype in self.listeners:
             # TODO: better error handling here
             return False
@@ -63,17 +91,17 @@ class EventListener():
     on = add_event_listener
 
     def remove_event_listener(self, etype):
-        try:
-            del(self.listeners[etype])
-        except KeyError:
-            pass
+        # pop with a default skips the exception machinery on a miss
+        self.listeners.pop(etype, None)
     off = remove_event_listener
 
     def add_publisher(self, publisher):
         self.publishers.add(publisher)
+    add_event_publisher = add_publisher
 
     def remove_publisher(self, publisher):
-        self.publishers.remove(publisher)
+        self.publishers.discard(publisher)
+    remove_event_publisher = remove_publisher
 
     def all(self):
         return self.listeners
@@ -88,23 +116,51 @@ class EventPublisher():
     """
 
     def __init__(self):
-        self.subscribers = set()
+        # a list iterates a contiguous array during fan-out, which a set
+        # does not; the set only guards against duplicate subscription
+        self.subscribers = list()
+        self._subscriber_set = set()
+        # bound on_notify methods cached in step with subscribers, so
+        # the fan-out loop skips the per-iteration attribute lookup
+        self._notify_methods = list()
+        # per-publisher lock so concurrent notify/subscribe on one
+        # topic never races, while separate topics stay independent
+        self._lock = threading.RLock()
         super(EventPublisher, self).__init__()
 
     def notify(self, event, topic=None):
         if topic:
-            topic.on_notify(event)
+            self.notify_topic(event, topic)
         else:
-            for l in self.subscribers:
-                l.on_notify(event)
+            self.notify_all(event)
     emit = notify
 
+    def notify_topic(self, event, topic):
+        topic.on_notify(event)
+
+    def notify_all(self, event):
+        # snapshot under the lock, then fan out without it -- holding
+        # the lock across user callbacks would block subscribe/
+        # unsubscribe and invites deadlock if a callback re-enters us
+        with self._lock:
+            snapshot = self._notify_methods.copy()
+        for m in snapshot:
+            m(event)
+
     def add_subscriber(self, subscriber):
-        self.subscribers.add(subscriber)
+        with self._lock:
+            if subscriber in self._subscriber_set:
+                return
+            self._subscriber_set.add(subscriber)
+            self.subscribers.append(subscriber)
+            self._notify_methods.append(subscriber.on_notify)
         subscriber.add_event_publisher(self)
 
     def remove_subscriber(self, subscriber):
-        self.subscribers.remove(subscriber)
+        with self._lock:
+            self._subscriber_set.remove(subscriber)
+            self.subscribers.remove(subscriber)
+            self._notify_methods.remove(subscriber.on_notify)
         subscriber.remove_event_publisher(self)
 
 class EventTopic(EventListener, EventPublisher):
@@ -120,6 +176,17 @@ class EventTopic(EventListener, EventPublisher):
         self.name = name
         super(EventTopic, self).__init__()
 
+    def on_notify(self, event):
+        # dispatch to the topic's own handlers, then relay to
+        # subscribers through the cached bound methods. The inherited
+        # path is skipped on purpose: it would inject the topic's
+        # owner (always None) as event.data["self"], blocking each
+        # subscriber from injecting its own owner
+        handler = self.listeners.get(event.type)
+        if handler is not None:
+            handler(event.data)
+        self.notify_all(event)
+
 class EventStream():
     """
     EventStream will likely become a global Script. This keeps track of all topics,
@@ -129,29 +196,32 @@ class EventStream():
 
     def __init__(self):
         self.topics = dict()
+        # guards membership changes on the topics dict; per-topic
+        # traffic is protected by each EventTopic's own lock
+        self._lock = threading.RLock()
 
     def create(self, topic):
-        if topic in self.topics:
-            raise EventException(
-                "EventTopic already exists: {topic}")
-        else:
-            new_topic = EventTopic(topic)
-            self.topics[new_topic.name] = new_topic
-            return new_topic
+        with self._lock:
+            if topic in self.topics:
+                raise EventException(
+                    f"EventTopic already exists: {topic}")
+            else:
+                new_topic = EventTopic(topic)
+                self.topics[new_topic.name] = new_topic
+                return new_topic
 
     def add(self, topic):
-        if topic.name in self.topics:
-            raise EventException(
-                "EventTopic already exists: {topic.name}")
-        else:
-            self.topics[topic.name] = topic
-            return True
+        with self._lock:
+            if topic.name in self.topics:
+                raise EventException(
+                    f"EventTopic already exists: {topic.name}")
+            else:
+                self.topics[topic.name] = topic
+                return True
 
     def get(self, topic):
-        if topic in self.topics:
-            return self.topics[topic]
-        else:
-            return None
+        with self._lock:
+            return self.topics.get(topic)
 
     def notify(self, event, topic):
         topic = self.get(topic)
@@ -159,16 +229,29 @@ class EventStream():
             topic.notify(event)
 
     def broadcast(self, event):
-        raise NotImplementedError
+        # snapshot the topics under the stream lock, then deliver
+        # without holding it across topic callbacks
+        with self._lock:
+            topics = list(self.topics.values())
+        for t in topics:
+            t.on_notify(event)
 
     def multicast(self, event, topics):
-        raise NotImplementedError
+        # topics are pre-resolved EventTopic references, so delivery
+        # does no per-name dict lookups; see multicast_by_name for the
+        # name-based variant
+        for t in topics:
+            t.on_notify(event)
+
+    def multicast_by_name(self, event, names):
+        for name in names:
+            topic = self.get(name)
+            if topic:
+                topic.on_notify(event)
 
     def remove(self, topic):
-        try:
-            del(self.topics[topic])
-        except KeyError:
-            pass
+        with self._lock:
+            self.topics.pop(topic, None)
 
     @property
     def len(self):
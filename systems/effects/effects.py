@@ -1,12 +1,27 @@
 import json
 import os, sys
+import threading
 import uuid
-from ...base.events import EventListener, EventTopic, EventFactory
-from collections import namedtuple, deque, OrderedDict
-from functools import wraps, partial
+from ...base.events import (EventListener, EventTopic, EventFactory,
+                            SELF, SOURCE, TARGET)
+from collections import deque, OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from functools import lru_cache, wraps, partial
 
 from evennia import DefaultScript
 
+# pre-normalized Event types emitted by EffectHandler, interned so
+# dispatch against them is a pointer compare
+APPLIED = sys.intern("APPLIED")
+APPLIED_BATCH = sys.intern("APPLIED_BATCH")
+REFRESHED = sys.intern("REFRESHED")
+REMOVED = sys.intern("REMOVED")
+
+# per-thread pool of scratch payload dicts reused by
+# EffectHandler.emit_to
+_scratch = threading.local()
+
 
 class EffectException(Exception):
     """
@@ -38,6 +53,13 @@ class Effect():
         commit (func): Method gets assigned here on implementation
     """
 
+    # Effects are created constantly (every cast, buff tick, etc), so
+    # slots drop the per-instance __dict__ and make attribute access a
+    # fixed-offset lookup
+    __slots__ = ('metadata', 'name', 'type', 'power', 'trait',
+                 'refreshable', 'stackable', 'stacks', 'unique',
+                 'interval', 'ticks', 'commit', 'events', '_display')
+
     def __init__(self, metadata, name, type, trait, power=0,
                  refreshable=False, stackable=False, stacks=1, 
                  unique=False, interval=0, ticks=1):
@@ -57,9 +79,15 @@ class Effect():
         self.ticks = ticks
         self.commit = None
         self.events = EventListener(self)
+        self._display = None
 
     def __str__(self):
-        return f"{self.name} ({self.type}): {self.metadata['description']}"
+        # rendered lazily and cached; name/type/description do not
+        # change once the Effect is built
+        if self._display is None:
+            self._display = (
+                f"{self.name} ({self.type}): {self.metadata['description']}")
+        return self._display
 
     def __call__(self, **data):
         self.commit(self, data)
@@ -81,23 +109,26 @@ class EffectFactory():
 
     @staticmethod
     def create(name):
-        row = EffectFactory.repo.db[name]
+        # single lookup; db keys are interned, so this is a
+        # pointer-compare hit for interned callers
+        row = EffectFactory.repo.db.get(sys.intern(name))
 
-        if row:
-            # build the Effect object
-            e = Effect(**row.data)
-            e.commit = row.func
+        if row is None:
+            raise EffectException(
+                f"Tried to create invalid Effect: {name}")
 
-            # set up events on the Effect
-            if row.events:
-                for event, func in row.events.items():
-                    e.events.add_event_listener(event, func)
+        # build the Effect object
+        e = Effect(**row.data)
+        e.commit = row.func
 
-            # done
-            return e
-        else:
-            raise EffectException(
-                "Tried to create invalid Effect: {name}")
+        # set up events on the Effect; row.events already holds the
+        # final interned, uppercased keys, so the listener table can be
+        # adopted as a shallow copy instead of re-inserted key by key
+        if row.events:
+            e.events.listeners = row.events.copy()
+
+        # done
+        return e
 
 class EffectHandler():
     """
@@ -107,99 +138,154 @@ class EffectHandler():
     """
 
     def __init__(self, obj):
-        self._dict = OrderedDict()
+        # two-level layout: priority -> {type: bucket} makes priority
+        # queries O(1), while the flat type -> bucket map serves the
+        # add/remove hot path; both share the same deque objects
+        self._by_priority = dict()
+        self._by_type = dict()
         self.obj = obj
         self.topic = EventTopic(f"{self.obj.name}-EffectHandler")
         self.prioritized = False # TODO: implement optional prioritization
 
     def add(self, effect, priority=0, **data):
-        # index effects by type
+        # index effects by type; fetch the bucket once, creating it
+        # on first use
         idx = effect.type
-        # if the type is not in here, we create
-        # the entry for it
-        if idx not in self._dict:
-            if effect.unique:
-                self._dict[idx] = deque([], 1)
+        bucket = self._by_type.get(idx)
+        if bucket is None:
+            bucket = deque([], 1) if effect.unique else deque()
+            self._by_type[idx] = bucket
+            self._by_priority.setdefault(priority, dict())[idx] = bucket
+
+        # stackable doesn't depend on or decide anything, so we can safely do it
+        # first
+        if effect.stackable:
+            # TODO: Implement a _stack_effect to copy certain values over
+            # to new effect
+            pass
+        if effect.unique:
+            if effect.refreshable:
+                # TODO: Implement a _refresh_effect to copy certain values over
+                # to new effect, that way stacks would not be lost on refresh
+                bucket.appendleft(effect)
+                self.emit_to(effect, REFRESHED, data)
             else:
-                self._dict[idx] = deque()
-
-        # if it IS already in, we have several
-        # checks to do
-        if idx in self._dict:
-            # stackable doesn't depend on or decide anything, so we can safely do it
-            # first
-            if effect.stackable:
-                # TODO: Implement a _stack_effect to copy certain values over
-                # to new effect
-                pass
+                return (False, "UNIQUE_NO_REFRESH")
+        bucket.appendleft(effect)
+        self.emit_to(effect, APPLIED, data)
+
+    def add_many(self, effects, priority=0, **data):
+        """
+        Apply a batch of Effects in one call (an AOE spell landing
+        several Effects at once). Non-unique Effects are grouped by
+        type so each bucket is resolved a single time and extended in
+        bulk; unique Effects are routed through add() so its
+        refresh/rejection semantics (and per-Effect events) hold. One
+        APPLIED_BATCH event carrying everything that was applied is
+        published on the handler's topic, so listeners can react to
+        the batch as a unit.
+
+        Returns the list of Effects that were actually applied.
+        """
+        by_type = dict()
+        applied = list()
+        for effect in effects:
             if effect.unique:
-                if effect.refreshable:
-                    # TODO: Implement a _refresh_effect to copy certain values over
-                    # to new effect, that way stacks would not be lost on refresh
-                    self._dict[idx].appendleft(effect)
-                    self.emit_to(effect, "REFRESHED", data)
-                else:
-                    return (False, "UNIQUE_NO_REFRESH")
-        self._dict[idx].appendleft(effect)
-        self.emit_to(effect, "APPLIED", data)
+                # unique semantics live in add(); don't duplicate the
+                # checks here, and don't silently swap an Effect that
+                # add() would reject into its maxlen-1 bucket
+                if self.add(effect, priority, **data) is None:
+                    applied.append(effect)
+            else:
+                by_type.setdefault(effect.type, list()).append(effect)
+
+        for idx, batch in by_type.items():
+            bucket = self._by_type.get(idx)
+            if bucket is None:
+                bucket = deque()
+                self._by_type[idx] = bucket
+                self._by_priority.setdefault(priority, dict())[idx] = bucket
+            # TODO: per-effect stack checks as in add()
+            bucket.extendleft(batch)
+            applied.extend(batch)
+
+        data["effects"] = applied
+        data.setdefault(SOURCE, self.obj)
+        data[TARGET] = self.obj
+        self.notify(EventFactory.create_fast(APPLIED_BATCH, data))
+        return applied
 
     def remove(self, effect, **data):
-        idx = effect.type
-        if idx in self._dict:
-            self._dict[idx].pop()
-            self.emit_to(effect, "REMOVED", data)
+        bucket = self._by_type.get(effect.type)
+        if bucket is not None:
+            bucket.pop()
+            self.emit_to(effect, REMOVED, data)
 
     def notify(self, event):
         self.topic.notify(event)
 
     def emit_to(self, effect, status, data):
-        data["self"] = effect
-        try:
-            source = data["source"]
-        except KeyError: 
-            source = self.obj
-
-        e = EventFactory.create(status, source=source, target=self.obj, data=data)
+        # status is one of the pre-normalized constants above, so the
+        # event is built in place with no upper()/kwargs repacking.
+        # The payload is taken from a per-thread pool: the caller's
+        # dict is never mutated and steady-state emits allocate
+        # nothing, while a handler that re-enters add()/remove() gets
+        # its own dict instead of clobbering the one the outer
+        # callback is still reading. Dicts return to the pool when the
+        # callback finishes, so a listener that wants to keep the
+        # payload must copy it.
+        pool = getattr(_scratch, 'pool', None)
+        if pool is None:
+            pool = _scratch.pool = list()
+        d = pool.pop() if pool else dict()
+        d.update(data)
+        d[SELF] = effect
+        d.setdefault(SOURCE, self.obj)
+        d[TARGET] = self.obj
+
+        e = EventFactory.create_fast(status, d)
 
-        effect.events.on_notify(e)
+        try:
+            effect.events.on_notify(e)
+        finally:
+            d.clear()
+            pool.append(d)
 
     def _get_types_by_priority(self, priority):
-        rlist = list()
-        for idx in self._dict.keys():
-            if idx[0] == priority:
-                rlist.append(idx[1])
-        
-        return sorted(rlist)
+        return sorted(self._by_priority.get(priority, ()))
 
     def _get_types_by_keyword(self, keyword):
-        rlist = list()
-        for idx in self._dict.keys():
-            if keyword in idx[1]:
-                rlist.append(idx)
-
-        return sorted(rlist, key=lambda t: t[1])
+        return sorted(t for t in self._by_type if keyword in t)
 
-    def _sort_dict(self, dictobj):
-        current = 0
+    def _sort_dict(self):
+        # the priority level is already bucketed, so flattening is a
+        # walk over sorted priorities with no rescans
         sorted_dict = OrderedDict()
-        for x in sorted(self._dict.keys(), key=lambda t: t[0]):
-            priority = x[0]
-            if priority == current:
-                for etype in self._get_types_by_priority(priority):
-                    sorted_dict[(priority, etype)] = dictobj[(priority, etype)]
-                current += 1
-            else:
-                continue
+        for priority in sorted(self._by_priority):
+            types = self._by_priority[priority]
+            for etype in sorted(types):
+                sorted_dict[(priority, etype)] = types[etype]
+
+        return sorted_dict
 
     @property
     def len(self):
-        return len(self._dict)
+        return len(self._by_type)
 
     @property
     def length(self):
-        return len(self._dict)
+        return len(self._by_type)
 
-EffectRepositoryRow = namedtuple('EffectRepositoryRow', ['data', 'func', 'events'])
+@dataclass(slots=True)
+class EffectRepositoryRow:
+    """
+    A single Effect record in the repository: its raw data, its commit
+    implementation, and its event implementations. Mutable so that
+    implementations can be attached in place without rebuilding the row.
+    """
+    data: dict
+    func: Callable | None = None
+    events: dict = field(default_factory=dict)
 
 class EffectRepository():
     """
@@ -212,34 +298,32 @@ class EffectRepository():
     db = dict()
 
     def __init__(self):
-        self.data = str()
+        self.data = None
         self.uniques = set()
         self.load()
         for effect in self.data:
-            try:
-                # convert str -> boolean
-                if effect["unique"].lower() == "true":
-                    effect["unique"] = True
-                    # add it to uniques list if unique
-                    self.uniques.add(effect["type"])
-                else:
-                    effect["unique"] = False
-            except KeyError:
-                # it's not defined, so assume it's not unique
-                # and default to False
-                effect["unique"] = False
-
-            # add to effect DB 
-            ename = effect["name"]
+            # convert str -> boolean; a row without the key defaults
+            # to False with no exception path
+            effect["unique"] = str(effect.get("unique", False)).lower() == "true"
+            effect["type"] = sys.intern(effect["type"])
+            if effect["unique"]:
+                # add it to uniques list if unique
+                self.uniques.add(effect["type"])
+
+            # add to effect DB
+            ename = effect["name"] = sys.intern(effect["name"])
             if ename in EffectRepository.db.keys():
                 raise EffectException(
-                    "Duplicate Effect name in effects.json: {ename}")
-            EffectRepository.db[ename] = EffectRepositoryRow(effect, None, {})
+                    f"Duplicate Effect name in effects.json: {ename}")
+            EffectRepository.db[ename] = EffectRepositoryRow(effect)
 
     def load(self):
         dirname, _ = os.path.split(os.path.abspath(__file__))
         with open(os.path.join(dirname, 'effects.json')) as effects:
             self.data = json.load(effects)
+        # cached answers may be stale after a (re)load
+        self.is_unique.cache_clear()
+        self._where.cache_clear()
     # alias reload to load method
     # TODO: reload should do more checking to make sure it doesn't crash
     # the MUD on error
@@ -250,24 +334,22 @@ class EffectRepository():
         return len(self.data)
 
     def add_effect_implementation(self, name, func):
-        try:
-            row = EffectRepository.db[name]
-        except KeyError:
+        row = EffectRepository.db.get(name)
+        if row is None:
             raise EffectException(
                 f"Tried to implement unknown Effect: {name}")
 
-        if row.func == None:
-            EffectRepository.db[name] = row._replace(func=func)
+        if row.func is None:
+            row.func = func
         else:
             raise EffectException(
                 f"Unable to redefine Effect: {name}")
 
     def add_effect_event_implementation(self, name, event, func):
-        event = event.upper()
+        event = sys.intern(event.upper())
 
-        try:
-            row = EffectRepository.db[name]
-        except KeyError:
+        row = EffectRepository.db.get(name)
+        if row is None:
             raise EffectException(
                 f"Tried to implement Event for unknown Effect: {name}")
 
@@ -276,7 +358,6 @@ class EffectRepository():
                 f"Unable to redefine Effect Event: {name}:{event}")
         else:
             row.events[event] = func
-            EffectRepository.db[name] = row._replace(events=row.events)
 
     def implement(self, name, event={}):
         @wraps(self, name)
@@ -289,7 +370,10 @@ class EffectRepository():
 
         return decorator
 
+    @lru_cache(maxsize=None)
     def is_unique(self, etype):
+        # called on every EffectHandler.add; memoized so repeated
+        # types collapse to a cache hit
         return etype in self.uniques
 
     def where(self, **search):
@@ -297,7 +381,13 @@ class EffectRepository():
         This method will search through self.data to enable finding Effects
         by type, name, etc.
 
-        TODO: Implement
+        Returns a tuple of all effect rows matching every given
+        key/value pair, e.g. ``where(type="poison")``. Results are
+        memoized per filter, so repeated queries are cache hits.
         """
+        return self._where(tuple(sorted(search.items())))
 
-        raise NotImplementedError
+    @lru_cache(maxsize=256)
+    def _where(self, search):
+        return tuple(row for row in self.data
+                     if all(row.get(key) == value for key, value in search))